@@ -20,6 +20,9 @@ import (
 	"github.com/newrelic/nri-kafka/src/args"
 )
 
+// topicNameRegex extracts the topic name from a producer/consumer topic MBean name
+var topicNameRegex = regexp.MustCompile(`topic="?([^,"]+)"?`)
+
 // GetBrokerMetrics collects all Broker JMX metrics and stores them in sample
 func GetBrokerMetrics(sample *metric.Set, conn connection.JMXConnection) {
 	CollectMetricDefinitions(sample, brokerMetricDefs, nil, conn)
@@ -229,10 +232,9 @@ func getAllTopicsFromJMX(producer string, conn connection.JMXConnection) ([]stri
 		os.Exit(1)
 	}
 
-	r := regexp.MustCompile(`topic="?([^,"]+)"?`)
 	uniqueTopics := make(map[string]struct{})
 	for _, attr := range result {
-		match := r.FindStringSubmatch(attr.Name)
+		match := topicNameRegex.FindStringSubmatch(attr.Name)
 		if match == nil {
 			continue
 		}